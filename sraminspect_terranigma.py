@@ -40,9 +40,22 @@ the slot as broken and will behave as if the slot were blank.
 """
 
 import collections
+import functools
+import operator
 import os
+import struct
 import sys
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 ENDIANNESS = 'little'
 SRM_SIZE = 0x2000
 MIRR_COUNT = 0x2
@@ -55,86 +68,47 @@ CHKSUM_IV = 0x5236
 CHKSUM_SIZE = 0x4
 OUT_FNAME_FMT = "{}.changed.srm"
 
-CHAR_LUT = {
-    0x20: ' ',
-    0x21: 'A',
-    0x22: 'B',
-    0x23: 'C',
-    0x24: 'D',
-    0x25: 'E',
-    0x26: 'F',
-    0x27: 'G',
-    0x28: 'H',
-    0x29: 'I',
-    0x2A: 'J',
-    0x2B: 'K',
-    0x2C: 'L',
-    0x2D: 'M',
-    0x2E: 'N',
-    0x2F: 'O',
-    0x30: 'P',
-    0x31: 'Q',
-    0x32: 'R',
-    0x33: 'S',
-    0x34: 'T',
-    0x35: 'U',
-    0x36: 'V',
-    0x37: 'W',
-    0x38: 'X',
-    0x39: 'Y',
-    0x3A: 'Z',  # 0x3B..0x40 ?
-    0x41: 'a',
-    0x42: 'b',
-    0x43: 'c',
-    0x44: 'd',
-    0x45: 'e',
-    0x46: 'f',
-    0x47: 'g',
-    0x48: 'h',
-    0x49: 'i',
-    0x4A: 'j',
-    0x4B: 'k',
-    0x4C: 'l',
-    0x4D: 'm',
-    0x4E: 'n',
-    0x4F: 'o',
-    0x50: 'p',
-    0x51: 'q',
-    0x52: 'r',
-    0x53: 's',
-    0x54: 't',
-    0x55: 'u',
-    0x56: 'v',
-    0x57: 'w',
-    0x58: 'x',
-    0x59: 'y',
-    0x5A: 'z',
-}
-CHAR_LUT_REV = dict(zip(CHAR_LUT.values(), CHAR_LUT.keys()))
+# Decoding table for bytes.translate: in-game character code -> ASCII
+# codepoint, with '?' for unknown codes. 0x20 is a space, 0x21..0x3A are
+# 'A'..'Z' and 0x41..0x5A are 'a'..'z' (0x3B..0x40 ?).
+_DEC_TABLE = bytearray(b'?' * 256)
+_DEC_TABLE[0x20:0x3B] = b' ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_DEC_TABLE[0x41:0x5B] = b'abcdefghijklmnopqrstuvwxyz'
+_DEC_TABLE = bytes(_DEC_TABLE)
+
+# Encoding table for the opposite direction: ASCII/latin-1 codepoint ->
+# in-game character code, with 0x20 (space) for anything the game cannot
+# display.
+_ENC_TABLE = bytearray(b'\x20' * 256)
+for _code, _char in enumerate(_DEC_TABLE):
+    if _char != 0x3F:  # '?' marks codes without a character
+        _ENC_TABLE[_char] = _code
+_ENC_TABLE = bytes(_ENC_TABLE)
+del _code, _char
 
 
 def terra_atob(a):
-    return CHAR_LUT_REV.get(a, 0x20)
+    codepoint = ord(a)
+    return _ENC_TABLE[codepoint] if codepoint < 256 else 0x20
 
 
 def terra_stob(s):
-    return (bytes(terra_atob(x) for x in s[0:5]) + b'\xD4').ljust(6, b'\x00')
+    encoded = s[0:5].encode('latin-1', 'replace').translate(_ENC_TABLE)
+    return (encoded + b'\xD4').ljust(6, b'\x00')
 
 
 def terra_btos(b):
-    end = None
-    try:
-        end = b.index(0xD4)
-    except ValueError:
-        pass
-    if end is None:
+    # Accept any bytes-like object (callers may pass memoryview slices).
+    b = bytes(b)
+    end = b.find(0xD4)
+    if end < 0:
         return ''
 
     # If the default name ("Ark") is not changed when creating a new savegame,
     # the game additionally puts a 0xD1 before the terminating 0xD4,
     # which is not a visible character in-game.
     tmp = b[0:end].rstrip(b'\xD1')
-    return ''.join(CHAR_LUT.get(x, '?') for x in tmp)
+    return tmp.translate(_DEC_TABLE).decode('ascii')
 
 
 SLOT_VARS = collections.OrderedDict([
@@ -143,29 +117,82 @@ SLOT_VARS = collections.OrderedDict([
 ])
 
 
-def slot_offset(mirror, slot):
-    return MIRR_OFFSET * mirror + MIRR_SLACK + SLOT_OFFSET * slot
+# Only MIRR_COUNT * SLOT_COUNT (mirror, slot) pairs exist, so the offsets
+# are materialized once at import time instead of recomputed per call.
+_SLOT_OFFSETS = tuple(MIRR_OFFSET * mirror + MIRR_SLACK + SLOT_OFFSET * slot
+                      for mirror in range(MIRR_COUNT)
+                      for slot in range(SLOT_COUNT))
 
 
-def calc_checksum(data, mirror, slot):
-    chksum1 = chksum2 = CHKSUM_IV
-    word = 0
+def slot_offset(mirror, slot):
+    return _SLOT_OFFSETS[mirror * SLOT_COUNT + slot]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _calc_checksum_nb(buf, base, size, chksum_iv):
+        chksum1 = chksum2 = chksum_iv
+        i = 0
+        while i <= size:
+            word = buf[base + i] | (buf[base + i + 1] << 8)
+            chksum1 = (chksum1 + word) & 0xFFFF
+            chksum2 ^= word
+            i += 2
+        return chksum1, chksum2
+else:
+    _calc_checksum_nb = None
+
+# The checksummed region has a fixed size, so the fallback path can unpack
+# all of its words with one precompiled struct call instead of looping.
+_CHKSUM_STRUCT = struct.Struct('<{}H'.format(SLOT_SIZE // 2 + 1))
+
+
+def calc_checksum_raw(data, mirror, slot):
+    addr_orig = slot_offset(mirror, slot)
+
+    if _calc_checksum_nb is not None:
+        buf = np.frombuffer(data, dtype=np.uint8)
+        return _calc_checksum_nb(buf, addr_orig, SLOT_SIZE, CHKSUM_IV)
+
+    if np is not None:
+        # The game sums whole words starting at offsets 0..SLOT_SIZE, so with
+        # the odd SLOT_SIZE the summed region is SLOT_SIZE + 1 bytes long.
+        arr = np.frombuffer(data, dtype='<u2',
+                            count=SLOT_SIZE // 2 + 1, offset=addr_orig)
+        # Both reductions run back-to-back over the same ~1.2 KiB view, so
+        # the second pass hits L1. They are independent per-word ops, so
+        # their order relative to the original interleaved loop is
+        # irrelevant.
+        chksum1 = (CHKSUM_IV + int(arr.sum(dtype=np.uint32))) % 0x10000
+        chksum2 = CHKSUM_IV ^ int(np.bitwise_xor.reduce(arr))
+    else:
+        words = _CHKSUM_STRUCT.unpack_from(data, addr_orig)
+        chksum1 = (CHKSUM_IV + sum(words)) & 0xFFFF
+        chksum2 = functools.reduce(operator.xor, words, CHKSUM_IV)
+
+    return chksum1, chksum2
 
-    cur_addr = addr_orig = slot_offset(mirror, slot)
 
-    while True:
-        if cur_addr - addr_orig > SLOT_SIZE:
-            break
+def calc_checksum(data, mirror, slot):
+    return struct.pack('<HH', *calc_checksum_raw(data, mirror, slot))
 
-        word = int.from_bytes(data[cur_addr:cur_addr + 2], ENDIANNESS)
 
-        chksum1 = (word + chksum1) % 0x10000
-        chksum2 ^= word
+def _calc_checksums_batch(data):
+    # Stack the six slot regions into one (slots, words) matrix and reduce
+    # along axis 1, so all checksums come out of a single pair of
+    # vectorized passes. Order matches _SLOT_OFFSETS.
+    mat = np.stack([np.frombuffer(data, dtype='<u2',
+                                  count=SLOT_SIZE // 2 + 1, offset=offset)
+                    for offset in _SLOT_OFFSETS])
+    chksums1 = (CHKSUM_IV + mat.sum(axis=1, dtype=np.uint32)) & 0xFFFF
+    chksums2 = CHKSUM_IV ^ np.bitwise_xor.reduce(mat, axis=1)
+    return [(int(chksum1), int(chksum2))
+            for chksum1, chksum2 in zip(chksums1, chksums2)]
 
-        cur_addr += 2
 
-    return bytes(chksum1.to_bytes(2, ENDIANNESS) +
-                 chksum2.to_bytes(2, ENDIANNESS))
+def read_checksum_raw(data, mirror, slot):
+    offset = slot_offset(mirror, slot) + SLOT_SIZE + 1
+    return struct.unpack_from('<HH', data, offset)
 
 
 def read_checksum(data, mirror, slot):
@@ -176,15 +203,15 @@ def read_checksum(data, mirror, slot):
 def write_checksum(data, mirror, slot, new_checksum):
     offset = slot_offset(mirror, slot) + SLOT_SIZE + 1
     data[offset:offset + CHKSUM_SIZE] = new_checksum
-    return data
 
 
 def read_slot(data, mirror, slot):
     values = {}
     offset = slot_offset(mirror, slot)
 
-    for key, val in SLOT_VARS.items():
-        values[key] = val[2](data[offset + val[0]:offset + val[0] + val[1]])
+    for key, (var_offset, var_size, decode, _) in SLOT_VARS.items():
+        var_start = offset + var_offset
+        values[key] = decode(data[var_start:var_start + var_size])
 
     return values
 
@@ -193,21 +220,26 @@ def update_slot(data, update_dict, mirror, slot):
     offset = slot_offset(mirror, slot)
 
     for key, val in update_dict.items():
-        update_start = offset + SLOT_VARS[key][0]
-        update_end = update_start + SLOT_VARS[key][1]
-        data[update_start:update_end] = SLOT_VARS[key][3](val)
-
-    return data
+        var_offset, var_size, _, encode = SLOT_VARS[key]
+        update_start = offset + var_offset
+        data[update_start:update_start + var_size] = encode(val)
 
 
 def slot_is_uninitialized(data, mirror, slot):
     offset = slot_offset(mirror, slot)
-    test_words = data[offset:offset + 4]
-    return test_words[2:4] != b'\x01\x00' and test_words[0:2] == test_words[2:4]
+    test_words = int.from_bytes(data[offset:offset + 4], ENDIANNESS)
+    word_lo = test_words & 0xFFFF
+    word_hi = test_words >> 16
+    return word_hi != 0x0001 and word_lo == word_hi
 
 
 def read_sram_meta(data):
     sram_meta = {}
+    name_offset, name_size, name_decode, _ = SLOT_VARS["player_name"]
+
+    calced_checksums = None
+    if np is not None:
+        calced_checksums = _calc_checksums_batch(data)
 
     for mirror_idx in range(MIRR_COUNT):
         for slot_idx in range(SLOT_COUNT):
@@ -215,14 +247,26 @@ def read_sram_meta(data):
                 sram_meta[(mirror_idx, slot_idx)] = None
                 continue
 
-            _read_checksum = read_checksum(data, mirror_idx, slot_idx)
-            _calc_checksum = calc_checksum(data, mirror_idx, slot_idx)
+            # Compare the checksums as word pairs; the serialized form is
+            # only needed when a new checksum gets written back to the file.
+            stored_checksum = read_checksum_raw(data, mirror_idx, slot_idx)
+            if calced_checksums is not None:
+                calced_checksum = calced_checksums[
+                    mirror_idx * SLOT_COUNT + slot_idx]
+            else:
+                calced_checksum = calc_checksum_raw(data, mirror_idx, slot_idx)
+
+            # Only the player name is displayed, so decode just that field
+            # instead of going through read_slot, which decodes all of
+            # SLOT_VARS.
+            player_name = None
+            if stored_checksum == calced_checksum:
+                name_start = slot_offset(mirror_idx, slot_idx) + name_offset
+                player_name = name_decode(
+                    data[name_start:name_start + name_size])
+
             sram_meta[(mirror_idx, slot_idx)] = (
-                _read_checksum,
-                _calc_checksum,
-                read_slot(data, mirror_idx, slot_idx)[
-                    "player_name"] if _read_checksum == _calc_checksum else None
-            )
+                stored_checksum, calced_checksum, player_name)
 
     return sram_meta
 
@@ -282,9 +326,10 @@ def ask_slot_to_change(sram_meta):
 
 def ask_vars_to_change(data, mirror_to_change, slot_to_change):
     vars_to_change = {}
+    var_names = list(SLOT_VARS)
     slot_values = read_slot(data, mirror_to_change, slot_to_change)
     print("Changeable variables:")
-    for i, key in enumerate(SLOT_VARS):
+    for i, key in enumerate(var_names):
         print("{}: '{}',".format(i, key).ljust(30) +
               " current value: '{}'".format(slot_values[key]))
 
@@ -301,7 +346,7 @@ def ask_vars_to_change(data, mirror_to_change, slot_to_change):
                 print("Invalid value. Please provide an integer.")
                 continue
 
-            if -1 <= var_to_change <= len(SLOT_VARS):
+            if -1 <= var_to_change < len(var_names):
                 break
 
             print("This variable does not exist.")
@@ -309,7 +354,7 @@ def ask_vars_to_change(data, mirror_to_change, slot_to_change):
         if var_to_change == -1:
             break
 
-        var_name_to_change = list(SLOT_VARS.keys())[var_to_change]
+        var_name_to_change = var_names[var_to_change]
         new_value = input("Please provide the new value: ")
         vars_to_change[var_name_to_change] = new_value
 
@@ -333,18 +378,22 @@ def main():
         print("Could not open '{}': {}".format(sys.argv[1], err))
         return
 
-    sram_meta = read_sram_meta(data)
+    # Read through a memoryview so the hot read paths slice the buffer
+    # without copying; writes still go through the bytearray, which the
+    # view reflects.
+    view = memoryview(data)
+
+    sram_meta = read_sram_meta(view)
     display_sram_meta(sram_meta)
     mirror_to_change, slot_to_change = ask_slot_to_change(sram_meta)
-    vars_to_change = ask_vars_to_change(data, mirror_to_change, slot_to_change)
+    vars_to_change = ask_vars_to_change(view, mirror_to_change, slot_to_change)
 
     if not vars_to_change:
         print("No variables changed, nothing to do.")
         return
 
     out_fname = OUT_FNAME_FMT.format(
-        os.path.basename(
-            sys.argv[1].rstrip(".srm")))
+        os.path.basename(sys.argv[1]).removesuffix(".srm"))
     out_dir = os.path.dirname(os.path.abspath(sys.argv[1]))
     out_path = os.path.join(out_dir, out_fname)
     user_ok = input(
@@ -354,11 +403,11 @@ def main():
         return
 
     print("Updating savegame data...")
-    data = update_slot(data, vars_to_change, mirror_to_change, slot_to_change)
+    update_slot(data, vars_to_change, mirror_to_change, slot_to_change)
 
     print("Updating checksum...")
-    new_checksum = calc_checksum(data, mirror_to_change, slot_to_change)
-    data = write_checksum(data, mirror_to_change, slot_to_change, new_checksum)
+    new_checksum = calc_checksum(view, mirror_to_change, slot_to_change)
+    write_checksum(data, mirror_to_change, slot_to_change, new_checksum)
 
     print("Writing file...")
     try_again = True